@@ -5,6 +5,14 @@ class Settings(BaseSettings):
     SECRET_KEY : str
     ALGORITHM : str
     ACCESS_TOKEN_EXPIRE_MINUTES : int
+    REFRESH_TOKEN_EXPIRE_MINUTES : int = 60 * 24 * 7
+    REFRESH_TOKEN_ROTATE : bool = True
+
+    COUNTER_CACHE_SECONDS : float = 5.0
+    COUNTER_RECONCILE_SECONDS : float = 300.0
+
+    USER_CACHE_SIZE : int = 10000
+    USER_CACHE_TTL_SECONDS : float = 60.0
     
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -0,0 +1,126 @@
+import asyncio
+import datetime
+import time
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from . import config
+from . import models
+
+ITEMS = "items"
+MERCHANT_ITEMS = "items:merchant:"
+
+settings = config.get_settings()
+
+# name -> (value, loaded_at), only a read-through copy of the counters table
+cache: dict[str, tuple[int, float]] = {}
+
+
+def merchant_items(merchant_id: int) -> str:
+    return f"{MERCHANT_ITEMS}{merchant_id}"
+
+
+def count_statement(name: str):
+    statement = select(func.count(models.DBItem.id))
+    if name == ITEMS:
+        return statement
+    if name.startswith(MERCHANT_ITEMS):
+        merchant_id = int(name[len(MERCHANT_ITEMS):])
+        return statement.where(models.DBItem.merchant_id == merchant_id)
+
+    raise KeyError(name)
+
+
+async def count(session: AsyncSession, name: str) -> int:
+    return (await session.exec(count_statement(name))).one()
+
+
+async def add(session: AsyncSession, deltas: dict[str, int]):
+    # runs inside the caller's transaction so the counter commits with the row
+    for name, delta in deltas.items():
+        await session.exec(
+            update(models.DBCounter)
+            .where(models.DBCounter.name == name)
+            .values(
+                value=models.DBCounter.value + delta,
+                updated_date=datetime.datetime.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        cache.pop(name, None)
+
+
+async def store(session: AsyncSession, name: str, value: int):
+    counter = await session.get(models.DBCounter, name)
+    if counter is None:
+        counter = models.DBCounter(name=name)
+    counter.value = value
+    counter.updated_date = datetime.datetime.now()
+    session.add(counter)
+
+
+async def get(session: AsyncSession, name: str, exact: bool = False) -> tuple[int, bool]:
+    if exact:
+        return await count(session, name), True
+
+    cached = cache.get(name)
+    if cached and time.monotonic() - cached[1] < settings.COUNTER_CACHE_SECONDS:
+        return cached[0], False
+
+    value = (
+        await session.exec(
+            select(models.DBCounter.value).where(models.DBCounter.name == name)
+        )
+    ).first()
+
+    if value is None:
+        # first read of this counter, seed it from the real count
+        value = await count(session, name)
+        await store(session, name, value)
+        try:
+            await session.commit()
+        except IntegrityError:
+            # another request seeded it first
+            await session.rollback()
+
+    cache[name] = (value, time.monotonic())
+    return value, False
+
+
+async def reconcile(session: AsyncSession):
+    total = await count(session, ITEMS)
+    result = await session.exec(
+        select(models.DBItem.merchant_id, func.count(models.DBItem.id)).group_by(
+            models.DBItem.merchant_id
+        )
+    )
+    values = {ITEMS: total}
+    values.update({merchant_items(merchant_id): n for merchant_id, n in result})
+
+    # merchants without items any more drop back to zero
+    result = await session.exec(
+        select(models.DBCounter.name).where(
+            models.DBCounter.name.startswith(MERCHANT_ITEMS)
+        )
+    )
+    for name in result.all():
+        values.setdefault(name, 0)
+
+    for name, value in values.items():
+        await store(session, name, value)
+
+    await session.commit()
+    cache.clear()
+
+
+async def reconcile_forever(interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSession(models.engine) as session:
+                await reconcile(session)
+        except Exception as e:
+            print("counter reconcile failed", e)
@@ -13,6 +13,7 @@ from pydantic import ValidationError
 from . import models
 from . import security
 from . import config
+from . import cache
 from .models.users import User , DBUser, TokenData
 
 ALGORITHM = "HS256"
@@ -21,6 +22,25 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token")
 
 settings = config.get_settings()
 
+user_cache = cache.LRUCache(settings.USER_CACHE_SIZE, settings.USER_CACHE_TTL_SECONDS)
+
+
+async def load_user(session: AsyncSession, user_id: int) -> User | None:
+    user = user_cache.get(user_id)
+    if user is None:
+        db_user = await session.get(DBUser, user_id)
+        if db_user is None:
+            return None
+
+        user = User.model_validate(db_user)
+        user_cache.set(user_id, user)
+
+    return user
+
+
+def invalidate_user(user_id: int):
+    user_cache.pop(user_id)
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -35,16 +55,16 @@ async def get_current_user(
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
-        user_id: int = payload.get("sub")
-
-        if user_id is None:
+        if payload.get("type") == "refresh":
             raise credentials_exception
 
-    except jwt.JWTError as e:
+        user_id: int = int(payload.get("sub"))
+
+    except (InvalidTokenError, TypeError, ValueError) as e:
         print(e)
         raise credentials_exception
 
-    user = await session.get(DBUser, user_id)
+    user = await load_user(session, user_id)
     if user is None:
         raise credentials_exception
 
@@ -3,10 +3,13 @@ from gevent import monkey
 
 monkey.patch_all()
 
+import asyncio
+
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from . import config
+from . import counters
 from . import models
 
 from . import routers
@@ -14,7 +17,14 @@ from . import routers
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    settings = app.state.settings
+    reconcile_task = asyncio.create_task(
+        counters.reconcile_forever(settings.COUNTER_RECONCILE_SECONDS)
+    )
+
     yield
+
+    reconcile_task.cancel()
     if models.engine is not None:
         # Close the DB connection
         await models.session_close()
@@ -25,6 +35,7 @@ def create_app(settings=None):
         settings = config.get_settings()
 
     app = FastAPI(lifespan=lifespan)
+    app.state.settings = settings
 
     models.init_db(settings)
 
@@ -10,6 +10,8 @@ from .items import *
 from .merchants import *
 from .transactions import *
 from .wallets import *
+from .counters import *
+from .tokens import *
 
 
 connect_args = {}
@@ -0,0 +1,10 @@
+import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class DBCounter(SQLModel, table=True):
+    __tablename__ = "counters"
+    name: str = Field(primary_key=True)
+    value: int = 0
+    updated_date: datetime.datetime = Field(default_factory=datetime.datetime.now)
@@ -45,3 +45,6 @@ class ItemList(BaseModel):
     page: int
     page_count: int
     size_per_page: int
+    next_cursor: str | None = None
+    total_count: int | None = None
+    total_count_exact: bool = False
@@ -43,3 +43,4 @@ class MerchantList(BaseModel):
     page: int
     page_size: int
     size_per_page: int
+    next_cursor: str | None = None
@@ -0,0 +1,20 @@
+import datetime
+
+from pydantic import BaseModel
+from sqlmodel import Field, SQLModel
+
+
+class RefreshToken(BaseModel):
+    refresh_token: str
+
+
+class DBRefreshToken(SQLModel, table=True):
+    __tablename__ = "refresh_tokens"
+    jti: str = Field(primary_key=True)
+    family: str = Field(index=True)
+    user_id: int = Field(default=None, foreign_key="users.id")
+
+    used: bool = False
+    revoked: bool = False
+    expires_at: datetime.datetime
+    created_date: datetime.datetime = Field(default_factory=datetime.datetime.now)
@@ -42,3 +42,20 @@ class TransactionList(BaseModel):
     page: int
     page_size: int
     size_per_page: int
+    next_cursor: str | None = None
+
+
+class CartItem(BaseModel):
+    item_id: int
+    quantity: int
+
+
+class Checkout(BaseModel):
+    items: list[CartItem]
+    user_id: int | None = 0
+
+
+class CheckoutResult(BaseModel):
+    transactions: list[Transaction]
+    total_price: float
+    balance: float
@@ -0,0 +1,57 @@
+import base64
+import json
+
+from fastapi import HTTPException
+
+from sqlalchemy import tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != length:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def after(columns, values):
+    if len(columns) == 1:
+        return columns[0] > values[0]
+    return tuple_(*columns) > tuple_(*values)
+
+
+async def paginate(
+    session: AsyncSession,
+    statement,
+    columns: list,
+    size: int,
+    page: int = 1,
+    cursor: str | None = None,
+):
+    # keyset mode when a cursor is given, offset mode otherwise.
+    # both modes hand back a cursor for the row after the last one returned.
+    statement = statement.order_by(*columns)
+    if cursor:
+        statement = statement.where(after(columns, decode_cursor(cursor, len(columns))))
+    else:
+        statement = statement.offset((page - 1) * size)
+
+    rows = (await session.exec(statement.limit(size + 1))).all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_cursor(*(getattr(rows[-1], c.key) for c in columns))
+
+    return rows, next_cursor
@@ -0,0 +1,154 @@
+from fastapi import HTTPException
+
+from sqlalchemy import case, insert, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from . import models
+
+
+async def take_stock(session: AsyncSession, item_id: int, quantity: int):
+    # decrement only if enough stock is left, the row lock is held until commit
+    result = await session.exec(
+        update(models.DBItem)
+        .where(models.DBItem.id == item_id, models.DBItem.quantity >= quantity)
+        .values(quantity=models.DBItem.quantity - quantity)
+        .returning(models.DBItem.price)
+        .execution_options(synchronize_session=False)
+    )
+    return result.one_or_none()
+
+
+async def debit_wallet(session: AsyncSession, wallet_id: int, amount: float):
+    result = await session.exec(
+        update(models.DBWallet)
+        .where(models.DBWallet.id == wallet_id, models.DBWallet.balance >= amount)
+        .values(balance=models.DBWallet.balance - amount)
+        .returning(models.DBWallet.balance)
+        .execution_options(synchronize_session=False)
+    )
+    return result.one_or_none()
+
+
+async def exists(session: AsyncSession, model, id: int) -> bool:
+    result = await session.exec(select(model.id).where(model.id == id))
+    return result.first() is not None
+
+
+async def raise_wallet_error(session: AsyncSession, wallet_id: int):
+    await session.rollback()
+    if not await exists(session, models.DBWallet, wallet_id):
+        raise HTTPException(status_code=404, detail="Wallet or Item not found")
+    raise HTTPException(status_code=400, detail="Insufficient balance")
+
+
+async def purchase(
+    session: AsyncSession,
+    wallet_id: int,
+    item_id: int,
+    quantity: int,
+    user_id: int | None = None,
+) -> models.Transaction:
+    if quantity <= 0:
+        raise HTTPException(status_code=400, detail="Quantity must be positive")
+
+    item = await take_stock(session, item_id, quantity)
+    if item is None:
+        await session.rollback()
+        if not await exists(session, models.DBItem, item_id):
+            raise HTTPException(status_code=404, detail="Wallet or Item not found")
+        raise HTTPException(status_code=400, detail="Insufficient quantity")
+
+    total_price = item.price * quantity
+    if await debit_wallet(session, wallet_id, total_price) is None:
+        await raise_wallet_error(session, wallet_id)
+
+    result = await session.exec(
+        insert(models.DBTransaction)
+        .values(
+            wallet_id=wallet_id,
+            item_id=item_id,
+            quantity=quantity,
+            total_price=total_price,
+            user_id=user_id,
+        )
+        .returning(models.DBTransaction.id)
+    )
+    transaction_id = result.scalar_one()
+    await session.commit()
+
+    return models.Transaction(
+        id=transaction_id,
+        total_price=total_price,
+        quantity=quantity,
+        user_id=user_id,
+    )
+
+
+async def checkout(
+    session: AsyncSession,
+    wallet_id: int,
+    cart: list[models.CartItem],
+    user_id: int | None = None,
+) -> models.CheckoutResult:
+    quantities: dict[int, int] = {}
+    for line in cart:
+        if line.quantity <= 0:
+            raise HTTPException(status_code=400, detail="Quantity must be positive")
+        quantities[line.item_id] = quantities.get(line.item_id, 0) + line.quantity
+
+    if not quantities:
+        raise HTTPException(status_code=400, detail="Cart is empty")
+
+    # one statement takes stock for the whole cart and returns the prices
+    wanted = case(quantities, value=models.DBItem.id)
+    result = await session.exec(
+        update(models.DBItem)
+        .where(models.DBItem.id.in_(quantities), models.DBItem.quantity >= wanted)
+        .values(quantity=models.DBItem.quantity - wanted)
+        .returning(models.DBItem.id, models.DBItem.price)
+        .execution_options(synchronize_session=False)
+    )
+    prices = {row.id: row.price for row in result}
+
+    if len(prices) != len(quantities):
+        await session.rollback()
+        result = await session.exec(
+            select(models.DBItem.id).where(models.DBItem.id.in_(quantities))
+        )
+        if len(result.all()) != len(quantities):
+            raise HTTPException(status_code=404, detail="Wallet or Item not found")
+        raise HTTPException(status_code=400, detail="Insufficient quantity")
+
+    rows = [
+        dict(
+            wallet_id=wallet_id,
+            item_id=item_id,
+            quantity=quantity,
+            total_price=prices[item_id] * quantity,
+            user_id=user_id,
+        )
+        for item_id, quantity in quantities.items()
+    ]
+    total_price = sum(row["total_price"] for row in rows)
+
+    wallet = await debit_wallet(session, wallet_id, total_price)
+    if wallet is None:
+        await raise_wallet_error(session, wallet_id)
+
+    result = await session.exec(
+        insert(models.DBTransaction)
+        .values(rows)
+        .returning(
+            models.DBTransaction.id,
+            models.DBTransaction.total_price,
+            models.DBTransaction.quantity,
+            models.DBTransaction.user_id,
+        )
+    )
+    transactions = [models.Transaction.model_validate(row) for row in result]
+    await session.commit()
+
+    return models.CheckoutResult(
+        transactions=transactions, total_price=total_price, balance=wallet.balance
+    )
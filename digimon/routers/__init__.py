@@ -1,4 +1,4 @@
-from . import items,merchants,transactions,wallets,users, authentication
+from . import items,merchants,transactions,wallets,users, authentication, internal
 
 
 def init_router(app):
@@ -7,4 +7,5 @@ def init_router(app):
     app.include_router(transactions.router)
     app.include_router(wallets.router)
     app.include_router(users.router)
-    app.include_router(authentication.router)
\ No newline at end of file
+    app.include_router(authentication.router)
+    app.include_router(internal.router)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import datetime
+import uuid
 from datetime import timedelta
 
 from typing import Annotated
@@ -6,14 +7,19 @@ from typing import Annotated
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from jwt.exceptions import InvalidTokenError
+
+from sqlalchemy import update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 from .. import security
 from .. import config
+from .. import deps
 from .. import models
 from ..models.users import User, DBUser, Token
+from ..models.tokens import RefreshToken, DBRefreshToken
 
 
 router = APIRouter(prefix="/token", tags=["autthentication"])
@@ -24,8 +30,6 @@ async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: Annotated[AsyncSession, Depends(models.get_session)],
 ) -> Token:
-    settings = config.get_settings()
-
     result = await session.exec(
         select(DBUser).where(DBUser.username == form_data.username)
     )
@@ -51,23 +55,111 @@ async def login_for_access_token(
     session.add(db_user)
     await session.commit()
     await session.refresh(db_user)
+    deps.invalidate_user(db_user.id)
+
+    token = issue_token(session, user.id, issued_at=user.last_login_date)
+    await session.commit()
+    return token
+
+
+@router.post("/refresh")
+async def refresh_access_token(
+    body: RefreshToken,
+    session: Annotated[AsyncSession, Depends(models.get_session)],
+) -> Token:
+    settings = config.get_settings()
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    try:
+        payload = security.decode_refresh_token(body.refresh_token)
+        user_id = int(payload["sub"])
+        jti = payload["jti"]
+        family = payload.get("fam", jti)
+    except (InvalidTokenError, KeyError, TypeError, ValueError):
+        raise credentials_exception
+
+    user = await deps.load_user(session, user_id)
+    if user is None or user.disabled:
+        raise credentials_exception
+
+    if not settings.REFRESH_TOKEN_ROTATE:
+        token = issue_token(session, user_id, refresh=False)
+        token.refresh_token = body.refresh_token
+        return token
+
+    result = await session.exec(
+        update(DBRefreshToken)
+        .where(
+            DBRefreshToken.jti == jti,
+            DBRefreshToken.used == False,
+            DBRefreshToken.revoked == False,
+        )
+        .values(used=True)
+        .returning(DBRefreshToken.jti)
+        .execution_options(synchronize_session=False)
+    )
+    if result.one_or_none() is None:
+        # a rotated token came back, treat the whole family as stolen
+        await session.exec(
+            update(DBRefreshToken)
+            .where(DBRefreshToken.family == family)
+            .values(revoked=True)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        raise credentials_exception
+
+    token = issue_token(session, user_id, family=family)
+    await session.commit()
+    return token
+
+
+def issue_token(
+    session: AsyncSession,
+    user_id: int,
+    issued_at: datetime.datetime | None = None,
+    family: str | None = None,
+    refresh: bool = True,
+) -> Token:
+    settings = config.get_settings()
+    now = datetime.datetime.now()
 
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security.create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
-    )
-    refresh_token = security.create_refresh_token(
-        data={"sub": user.username},
-        expires_delta=access_token_expires,
+        data={"sub": str(user_id)}, expires_delta=access_token_expires
     )
 
+    refresh_token = ""
+    if refresh:
+        jti = uuid.uuid4().hex
+        family = family or jti
+        refresh_token_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
+        refresh_token = security.create_refresh_token(
+            data={"sub": str(user_id), "jti": jti, "fam": family},
+            expires_delta=refresh_token_expires,
+        )
+
+        if settings.REFRESH_TOKEN_ROTATE:
+            session.add(
+                DBRefreshToken(
+                    jti=jti,
+                    family=family,
+                    user_id=user_id,
+                    expires_at=now + refresh_token_expires,
+                )
+            )
+
     return Token(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
         scope="",
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-        expires_at=datetime.datetime.now() + access_token_expires,
-        issued_at=user.last_login_date,
-        user_id=user.id,
-    )
\ No newline at end of file
+        expires_at=now + access_token_expires,
+        issued_at=issued_at or now,
+        user_id=str(user_id),
+    )
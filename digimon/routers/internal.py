@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from typing import Annotated
+
+from .. import deps
+from ..models.users import User
+
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/stats")
+async def read_stats(
+    current_user: Annotated[User, Depends(deps.get_current_activate_user)],
+) -> dict:
+    return dict(user_cache=deps.user_cache.stats())
@@ -2,12 +2,14 @@ from fastapi import APIRouter,  HTTPException, Depends
 
 from typing import Optional, Annotated
 
-from sqlmodel import Field, SQLModel, create_engine, Session, select , func
+from sqlmodel import Field, SQLModel, create_engine, Session, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .. import models
 from .. import deps
 from .. import security
+from .. import pagination
+from .. import counters
 
 import math
 
@@ -25,9 +27,12 @@ async def create_item(
     
     dbitem = models.DBItem.model_validate(item)
     dbitem.merchant_id = merchant_id
-    dbitem.user = current_user
+    dbitem.user_id = current_user.id
 
     session.add(dbitem)
+    await counters.add(
+        session, {counters.ITEMS: 1, counters.merchant_items(merchant_id): 1}
+    )
     await session.commit()
     await session.refresh(dbitem)
 
@@ -38,23 +43,42 @@ async def read_items(
     session: Annotated[AsyncSession, Depends(models.get_session)],
     page: int = 1,
     size_per_page: int = SIZE_PER_PAGE,
+    cursor: str | None = None,
+    merchant_id: int | None = None,
+    exact_count: bool = False,
 ) -> models.ItemList:
-    result = await session.exec(
-         select(models.DBItem).offset((page - 1) * size_per_page).limit(size_per_page)
+    statement = select(models.DBItem)
+    counter = counters.ITEMS
+    if merchant_id is not None:
+        statement = statement.where(models.DBItem.merchant_id == merchant_id)
+        counter = counters.merchant_items(merchant_id)
+
+    items, next_cursor = await pagination.paginate(
+        session,
+        statement,
+        [models.DBItem.id],
+        size_per_page,
+        page=page,
+        cursor=cursor,
     )
-    items = result.all()
 
-    page_count = int(
-        math.ceil(
-            (await session.exec(select(func.count(models.DBItem.id)))).first()
-            / size_per_page
-        )
+    total_count, total_count_exact = await counters.get(
+        session, counter, exact=exact_count
     )
+    page_count = int(math.ceil(total_count / size_per_page))
 
     print("page_count", page_count)
     print("items", items)
     return models.ItemList.from_orm(
-        dict(items=items,  page_count=page_count, page=page, size_per_page=size_per_page)
+        dict(
+            items=items,
+            page_count=page_count,
+            page=page,
+            size_per_page=size_per_page,
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_count_exact=total_count_exact,
+        )
     )
 
 
@@ -94,7 +118,13 @@ async def delete_item(
      current_user: Annotated[AsyncSession, Depends(deps.get_current_activate_user)],
      ) -> dict:
     db_item = await session.get(models.DBItem, item_id)
+    if db_item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+
     await session.delete(db_item)
+    await counters.add(
+        session, {counters.ITEMS: -1, counters.merchant_items(db_item.merchant_id): -1}
+    )
     await session.commit()
     
     return dict(message=f"delete success")
\ No newline at end of file
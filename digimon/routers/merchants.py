@@ -8,6 +8,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from .. import security
 from .. import deps
 from .. import models
+from .. import pagination
 
 router = APIRouter(prefix="/merchants", tags=["merchant"])
 
@@ -32,10 +33,25 @@ async def read_merchants(
     session: Annotated[AsyncSession, Depends(models.get_session)],
     page: int = 1, 
     page_size: int = 10,
+    cursor: str | None = None,
     ) -> models.MerchantList:
-    result = await session.exec(select(models.DBMerchant).offset((page - 1) * page_size).limit(page_size))
-    merchants = result.all()
-    return models.MerchantList.from_orm(dict(merchants=merchants, page_size=0, page=0, size_per_page=0))
+    merchants, next_cursor = await pagination.paginate(
+        session,
+        select(models.DBMerchant),
+        [models.DBMerchant.id],
+        page_size,
+        page=page,
+        cursor=cursor,
+    )
+    return models.MerchantList.from_orm(
+        dict(
+            merchants=merchants,
+            page_size=len(merchants),
+            page=page,
+            size_per_page=page_size,
+            next_cursor=next_cursor,
+        )
+    )
 
 
 @router.get("/{merchant_id}")
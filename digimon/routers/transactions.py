@@ -8,10 +8,26 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from .. import security
 from .. import deps
 from .. import models
+from .. import pagination
+from .. import purchases
 
 
 router = APIRouter(prefix="/transactions", tags=["transaction"])
 
+SIZE_PER_PAGE = 50
+
+@router.post("/{wallet_id}/checkout")
+async def checkout(
+    cart: models.Checkout,
+    wallet_id: int,
+    session: Annotated[AsyncSession, Depends(models.get_session)],
+    current_user: Annotated[AsyncSession, Depends(deps.get_current_activate_user)],
+    ) -> models.CheckoutResult:
+    return await purchases.checkout(
+        session, wallet_id, cart.items, user_id=cart.user_id
+    )
+
+
 @router.post("/{wallet_id}/{item_id}")
 async def create_transaction(
     transaction: models.CreatedTransaction, 
@@ -21,35 +37,13 @@ async def create_transaction(
     session: Annotated[AsyncSession, Depends(models.get_session)],
     current_user: Annotated[AsyncSession, Depends(deps.get_current_activate_user)],
     ) -> models.Transaction:
-    print("created_merchant", transaction)
-    data = transaction.dict()
-    db_transaction = models.DBTransaction(**data)
-    db_transaction.wallet_id = wallet_id
-    db_transaction.item_id = item_id
-    db_transaction.quantity = quantity_id
-
-    db_wallet = await session.get(models.DBWallet, wallet_id)
-    db_item = await session.get(models.DBItem, item_id)
-    if db_wallet is None or db_item is None:
-        raise HTTPException(status_code=404, detail="Wallet or Item not found")
-        
-    total_price = db_item.price * quantity_id
-    if db_wallet.balance < total_price:
-        raise HTTPException(status_code=400, detail="Insufficient balance")
-    
-    db_item.quantity -= quantity_id
-    db_item.sqlmodel_update(db_item.dict())
-        
-    db_wallet.balance -= total_price
-    db_wallet.sqlmodel_update(db_wallet.dict())
-
-    db_transaction.total_price = total_price
-
-    session.add(db_transaction)
-    await session.commit()
-    await session.refresh(db_transaction)
-
-    return models.Transaction.from_orm(db_transaction)
+    return await purchases.purchase(
+        session,
+        wallet_id,
+        item_id,
+        quantity_id,
+        user_id=transaction.user_id,
+    )
 
 
 @router.get("/{wallet_id}")
@@ -57,16 +51,25 @@ async def read_transactions(
     wallet_id: int,
     session: Annotated[AsyncSession, Depends(models.get_session)],
     current_user: Annotated[AsyncSession, Depends(deps.get_current_activate_user)],
+    page: int = 1,
+    size_per_page: int = SIZE_PER_PAGE,
+    cursor: str | None = None,
     ) -> models.TransactionList:
-    transactions = await session.exec(
-        select(models.DBTransaction).where(models.DBTransaction.wallet_id == wallet_id)
-    ).all()
+    transactions, next_cursor = await pagination.paginate(
+        session,
+        select(models.DBTransaction).where(models.DBTransaction.wallet_id == wallet_id),
+        [models.DBTransaction.id],
+        size_per_page,
+        page=page,
+        cursor=cursor,
+    )
 
     return models.TransactionList(
         transactions=transactions,
-        page=1,
+        page=page,
         page_size=len(transactions),
-        size_per_page=len(transactions),
+        size_per_page=size_per_page,
+        next_cursor=next_cursor,
     )
 
 
@@ -84,5 +84,6 @@ async def change_password(
     session.add(user)
     await session.commit()
     await session.refresh(user)
+    deps.invalidate_user(user.id)
     return {"message": "Password changed successfully"}
 
@@ -164,3 +164,19 @@ async def example_item_user1(
     await session.commit()
     await session.refresh(item)
     return item
+
+@pytest_asyncio.fixture(name = 'wallet_user1')
+async def example_wallet_user1(
+    session: models.AsyncSession, user1: DBUser, merchant_user1: models.DBMerchant
+) -> models.DBWallet:
+    wallet = models.DBWallet(
+      merchant_name=merchant_user1.name,
+      balance=100.0,
+      user_id=user1.id,
+      merchant_id=merchant_user1.id,
+    )
+
+    session.add(wallet)
+    await session.commit()
+    await session.refresh(wallet)
+    return wallet
@@ -0,0 +1,70 @@
+from httpx import AsyncClient
+from digimon import models
+from digimon.models.users import DBUser, Token
+import pytest
+
+
+async def login(client: AsyncClient, user: DBUser) -> dict:
+    payload = {"username": user.username, "password": "123456"}
+    response = await client.post("/token", data=payload)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_login(client: AsyncClient, user1: DBUser):
+    token = await login(client, user1)
+
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    response = await client.get("/users/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == user1.id
+
+
+@pytest.mark.asyncio
+async def test_refresh_token(client: AsyncClient, user1: DBUser):
+    token = await login(client, user1)
+
+    response = await client.post(
+        "/token/refresh", json={"refresh_token": token["refresh_token"]}
+    )
+    refreshed = response.json()
+
+    assert response.status_code == 200
+    assert refreshed["access_token"]
+    assert refreshed["refresh_token"] != token["refresh_token"]
+
+    headers = {"Authorization": f"Bearer {refreshed['access_token']}"}
+    response = await client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_family(client: AsyncClient, user1: DBUser):
+    token = await login(client, user1)
+
+    response = await client.post(
+        "/token/refresh", json={"refresh_token": token["refresh_token"]}
+    )
+    refreshed = response.json()
+
+    response = await client.post(
+        "/token/refresh", json={"refresh_token": token["refresh_token"]}
+    )
+    assert response.status_code == 401
+
+    response = await client.post(
+        "/token/refresh", json={"refresh_token": refreshed["refresh_token"]}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_not_an_access_token(client: AsyncClient, user1: DBUser):
+    token = await login(client, user1)
+
+    headers = {"Authorization": f"Bearer {token['refresh_token']}"}
+    response = await client.get("/users/me", headers=headers)
+
+    assert response.status_code == 401
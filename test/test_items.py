@@ -1,5 +1,5 @@
 from httpx import AsyncClient
-from digimon import models
+from digimon import counters, models
 from digimon.models.users import DBUser, Token
 import pytest
 
@@ -62,3 +62,71 @@ async def test_list_items(client: AsyncClient, item_user1: models.DBItem):
     assert check_item["id"] == item_user1.id
     assert check_item["name"] == item_user1.name
 
+@pytest.mark.asyncio
+async def test_list_items_with_cursor(
+    client: AsyncClient, session: models.AsyncSession, item_user1: models.DBItem
+):
+    item = models.DBItem(
+        name="item2",
+        price=1.0,
+        user_id=item_user1.user_id,
+        merchant_id=item_user1.merchant_id,
+    )
+    session.add(item)
+    await session.commit()
+
+    response = await client.get("/items", params={"size_per_page": 1})
+    data = response.json()
+
+    assert response.status_code == 200
+    assert len(data["items"]) == 1
+    assert data["next_cursor"]
+
+    response = await client.get(
+        "/items", params={"size_per_page": 1, "cursor": data["next_cursor"]}
+    )
+    next_data = response.json()
+
+    assert response.status_code == 200
+    assert next_data["items"][0]["id"] > data["items"][0]["id"]
+
+@pytest.mark.asyncio
+async def test_list_items_invalid_cursor(client: AsyncClient):
+
+    response = await client.get("/items", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_list_items_total_count(
+    client: AsyncClient,
+    session: models.AsyncSession,
+    item_user1: models.DBItem,
+    token_user1: Token,
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+
+    response = await client.get("/items")
+    before = response.json()
+
+    assert response.status_code == 200
+    assert before["total_count_exact"] is False
+
+    payload = {"name": "counted item", "merchant_id": item_user1.merchant_id}
+    response = await client.post(
+        f"/items/{item_user1.merchant_id}", json=payload, headers=headers
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/items")
+    assert response.json()["total_count"] == before["total_count"] + 1
+
+    await counters.reconcile(session)
+
+    response = await client.get("/items", params={"exact_count": True})
+    exact = response.json()
+    response = await client.get("/items")
+
+    assert exact["total_count_exact"] is True
+    assert response.json()["total_count"] == exact["total_count"]
+
@@ -0,0 +1,162 @@
+from httpx import AsyncClient
+from digimon import models
+from digimon.models.users import DBUser, Token
+import pytest
+
+
+async def create_item(session: models.AsyncSession, merchant: models.DBMerchant, **kwargs):
+    item = models.DBItem(
+        name="transaction item",
+        price=kwargs.get("price", 10.0),
+        quantity=kwargs.get("quantity", 5),
+        user_id=merchant.user_id,
+        merchant_id=merchant.id,
+    )
+    session.add(item)
+    await session.commit()
+    await session.refresh(item)
+    return item
+
+
+@pytest.mark.asyncio
+async def test_create_transaction(
+    client: AsyncClient,
+    session: models.AsyncSession,
+    token_user1: Token,
+    merchant_user1: models.DBMerchant,
+    wallet_user1: models.DBWallet,
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+    item = await create_item(session, merchant_user1)
+    payload = {"total_price": 0, "quantity": 0}
+
+    response = await client.post(
+        f"/transactions/{wallet_user1.id}/{item.id}?quantity_id=2",
+        json=payload,
+        headers=headers,
+    )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["id"] > 0
+    assert data["quantity"] == 2
+    assert data["total_price"] == 20.0
+
+    await session.refresh(wallet_user1)
+    await session.refresh(item)
+    assert wallet_user1.balance == 80.0
+    assert item.quantity == 3
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_insufficient_balance(
+    client: AsyncClient,
+    session: models.AsyncSession,
+    token_user1: Token,
+    merchant_user1: models.DBMerchant,
+    wallet_user1: models.DBWallet,
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+    item = await create_item(session, merchant_user1, price=60.0)
+    payload = {"total_price": 0, "quantity": 0}
+
+    response = await client.post(
+        f"/transactions/{wallet_user1.id}/{item.id}?quantity_id=2",
+        json=payload,
+        headers=headers,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Insufficient balance"
+
+    await session.refresh(wallet_user1)
+    await session.refresh(item)
+    assert wallet_user1.balance == 100.0
+    assert item.quantity == 5
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_insufficient_quantity(
+    client: AsyncClient,
+    session: models.AsyncSession,
+    token_user1: Token,
+    merchant_user1: models.DBMerchant,
+    wallet_user1: models.DBWallet,
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+    item = await create_item(session, merchant_user1, quantity=1)
+    payload = {"total_price": 0, "quantity": 0}
+
+    response = await client.post(
+        f"/transactions/{wallet_user1.id}/{item.id}?quantity_id=2",
+        json=payload,
+        headers=headers,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Insufficient quantity"
+
+
+@pytest.mark.asyncio
+async def test_checkout(
+    client: AsyncClient,
+    session: models.AsyncSession,
+    token_user1: Token,
+    merchant_user1: models.DBMerchant,
+    wallet_user1: models.DBWallet,
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+    item1 = await create_item(session, merchant_user1, price=10.0)
+    item2 = await create_item(session, merchant_user1, price=5.0)
+    payload = {
+        "items": [
+            {"item_id": item1.id, "quantity": 2},
+            {"item_id": item2.id, "quantity": 1},
+            {"item_id": item2.id, "quantity": 2},
+        ]
+    }
+
+    response = await client.post(
+        f"/transactions/{wallet_user1.id}/checkout", json=payload, headers=headers
+    )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert len(data["transactions"]) == 2
+    assert data["total_price"] == 35.0
+    assert data["balance"] == 65.0
+
+    await session.refresh(item1)
+    await session.refresh(item2)
+    assert item1.quantity == 3
+    assert item2.quantity == 2
+
+
+@pytest.mark.asyncio
+async def test_checkout_rolls_back_on_missing_stock(
+    client: AsyncClient,
+    session: models.AsyncSession,
+    token_user1: Token,
+    merchant_user1: models.DBMerchant,
+    wallet_user1: models.DBWallet,
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+    item1 = await create_item(session, merchant_user1, quantity=5)
+    item2 = await create_item(session, merchant_user1, quantity=1)
+    payload = {
+        "items": [
+            {"item_id": item1.id, "quantity": 2},
+            {"item_id": item2.id, "quantity": 2},
+        ]
+    }
+
+    response = await client.post(
+        f"/transactions/{wallet_user1.id}/checkout", json=payload, headers=headers
+    )
+
+    assert response.status_code == 400
+
+    await session.refresh(item1)
+    await session.refresh(wallet_user1)
+    assert item1.quantity == 5
+    assert wallet_user1.balance == 100.0
@@ -0,0 +1,43 @@
+from httpx import AsyncClient
+from digimon import deps, models
+from digimon.models.users import DBUser, Token
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_read_users_me_is_cached(
+    client: AsyncClient, user1: DBUser, token_user1: Token
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+    deps.invalidate_user(user1.id)
+    hits = deps.user_cache.hits
+
+    response = await client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == user1.username
+
+    response = await client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+    assert deps.user_cache.hits == hits + 1
+
+    response = await client.get("/internal/stats", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["user_cache"]["hits"] >= hits + 1
+
+
+@pytest.mark.asyncio
+async def test_change_password_evicts_cached_user(
+    client: AsyncClient, user1: DBUser, token_user1: Token
+):
+    headers = {"Authorization": f"{token_user1.token_type} {token_user1.access_token}"}
+
+    response = await client.get("/users/me", headers=headers)
+    assert deps.user_cache.get(user1.id) is not None
+
+    payload = {"current_password": "123456", "new_password": "123456"}
+    response = await client.put(
+        f"/users/{user1.id}/change_password", json=payload, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert user1.id not in deps.user_cache.entries